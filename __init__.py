@@ -8,15 +8,27 @@ Warning: This is a prototype implementation and has not been audited.
 Do not use in production!
 """
 
-from typing import Optional, Tuple
+import contextlib
+import hashlib
+import os
+import struct
+import tempfile
+from typing import List, Optional, Tuple
 from ._hashsig_py import (
     PyPublicKey as PublicKey,
     PySecretKey as SecretKey,
     PySignature as Signature,
     HashSigSHA3,
     HashSigPoseidon,
+    cpu_backend,
+    MESSAGE_LENGTH,
 )
 
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:
+    _blake3 = None
+
 __version__ = "0.1.0"
 __all__ = [
     "PublicKey",
@@ -25,8 +37,39 @@ __all__ = [
     "HashSigSHA3",
     "HashSigPoseidon",
     "SignatureScheme",
+    "cpu_backend",
+    "MESSAGE_LENGTH",
 ]
 
+# Messages longer than this are hashed in Python, so only the fixed-size digest
+# crosses into the backend. Shorter messages are cheaper to pass as they are.
+_PREHASH_THRESHOLD = 64
+
+# Environment variable naming the directory for cached key pairs (opt-in)
+_KEY_CACHE_ENV = "HASHSIG_CACHE_DIR"
+
+# Header of a cached key pair: public key length, secret key length, and the
+# secret key's prepared interval
+_KEY_CACHE_HEADER = struct.Struct("<QQQQ")
+
+
+def _blake2b_digest(message: bytes) -> bytes:
+    return hashlib.blake2b(message, digest_size=MESSAGE_LENGTH).digest()
+
+
+def _blake3_digest(message: bytes) -> bytes:
+    return _blake3(message).digest(length=MESSAGE_LENGTH)
+
+
+# Message digests a SignatureScheme can apply in Python before signing. "sha3_256"
+# is what the backends hash messages with themselves; the others are faster on
+# large messages but produce signatures only schemes using the same hash accept.
+_MESSAGE_HASHES = {
+    "sha3_256": None,
+    "blake2b": _blake2b_digest,
+    "blake3": _blake3_digest,
+}
+
 
 class SignatureScheme:
     """
@@ -39,10 +82,10 @@ class SignatureScheme:
         >>> scheme = SignatureScheme.sha3(lifetime=1_000_000)
         >>> pk, sk = scheme.key_gen()
         >>> 
-        >>> # Ensure the secret key is prepared for the epoch
+        >>> # Prepare the secret key for the epoch in the background
         >>> epoch = 42
-        >>> while not sk.is_prepared_for_epoch(epoch):
-        >>>     sk.advance_preparation()
+        >>> sk.start_background_preparation(epoch)
+        >>> sk.wait_prepared(epoch)
         >>> 
         >>> # Sign a message
         >>> message = b"Hello, world!"
@@ -55,42 +98,77 @@ class SignatureScheme:
     Important: Each (secret_key, epoch) pair must only be used ONCE for signing!
     """
     
-    def __init__(self, backend):
+    def __init__(self, backend, message_hash: str = "sha3_256"):
         """
         Initialize with a backend implementation.
         
         Args:
             backend: The underlying signature scheme (HashSigSHA3 or HashSigPoseidon)
+            message_hash: Digest applied to messages before signing and
+                         verifying: "sha3_256" (default), "blake2b", or
+                         "blake3" (requires the blake3 package).
+        
+        Raises:
+            ValueError: If the message hash is unknown or unavailable.
+        
+        Note:
+            With "blake2b" or "blake3", messages are hashed in Python and the
+            digest is signed in place of the message. Signatures are then only
+            accepted by schemes configured with the same message hash.
         """
+        if message_hash not in _MESSAGE_HASHES:
+            raise ValueError(f"Unknown message hash: {message_hash!r}")
+        if message_hash == "blake3" and _blake3 is None:
+            raise ValueError("The blake3 message hash requires the blake3 package")
         self._backend = backend
+        self._message_hash = _MESSAGE_HASHES[message_hash]
+        
+        # Bind the per-call backend methods once, so the hot paths skip looking
+        # them up on the backend for every signature
+        self._key_gen = backend.key_gen
+        self._sign = backend.sign
+        self._sign_prehashed = backend.sign_prehashed
+        self._sign_into = backend.sign_into
+        self._verify = backend.verify
+        self._verify_prehashed = backend.verify_prehashed
     
     @classmethod
-    def sha3(cls, lifetime: Optional[int] = None) -> "SignatureScheme":
+    def sha3(
+        cls,
+        lifetime: Optional[int] = None,
+        message_hash: str = "sha3_256",
+    ) -> "SignatureScheme":
         """
         Create a signature scheme using SHA3.
         
         Args:
             lifetime: Maximum number of epochs (signatures) this key can support.
                      Default is 2^20 (~1 million).
+            message_hash: Digest applied to messages (see __init__).
         
         Returns:
             A SignatureScheme instance using SHA3.
         """
-        return cls(HashSigSHA3(lifetime=lifetime))
+        return cls(HashSigSHA3(lifetime=lifetime), message_hash=message_hash)
     
     @classmethod
-    def poseidon(cls, lifetime: Optional[int] = None) -> "SignatureScheme":
+    def poseidon(
+        cls,
+        lifetime: Optional[int] = None,
+        message_hash: str = "sha3_256",
+    ) -> "SignatureScheme":
         """
         Create a signature scheme using Poseidon2.
         
         Args:
             lifetime: Maximum number of epochs (signatures) this key can support.
                      Default is 2^20 (~1 million).
+            message_hash: Digest applied to messages (see __init__).
         
         Returns:
             A SignatureScheme instance using Poseidon2.
         """
-        return cls(HashSigPoseidon(lifetime=lifetime))
+        return cls(HashSigPoseidon(lifetime=lifetime), message_hash=message_hash)
     
     def key_gen(
         self,
@@ -110,8 +188,47 @@ class SignatureScheme:
         
         Note:
             Key generation can be expensive, especially for large lifetimes.
+            If the HASHSIG_CACHE_DIR environment variable is set and a seed is
+            given, the generated keys are cached in that directory and reused
+            by later calls with the same seed, activation epoch, lifetime and
+            backend. Unreadable or malformed entries are regenerated, and a
+            cache that cannot be written is skipped. The cache holds secret
+            key material, so the directory must be kept as private as the
+            keys themselves.
+        """
+        cache_dir = os.environ.get(_KEY_CACHE_ENV)
+        if seed is None or not cache_dir:
+            return self._key_gen(seed=seed, activation_epoch=activation_epoch)
+        
+        path = _key_cache_path(cache_dir, self._backend, seed, activation_epoch)
+        keys = _load_cached_keys(path)
+        if keys is None:
+            keys = self._key_gen(seed=seed, activation_epoch=activation_epoch)
+            # The cache only saves time, so failing to write it is not an error
+            with contextlib.suppress(OSError):
+                _store_cached_keys(path, *keys)
+        return keys
+    
+    def key_gen_batch(
+        self,
+        n: int,
+        activation_epoch: int = 0,
+    ) -> List[Tuple[PublicKey, SecretKey]]:
+        """
+        Generate several key pairs in a single call.
+        
+        Args:
+            n: Number of key pairs to generate.
+            activation_epoch: The epoch at which the keys become active (default: 0).
+        
+        Returns:
+            A list of (public_key, secret_key) tuples.
+        
+        Note:
+            Prefer this over calling key_gen() in a loop when many keys are
+            needed, as the backend can batch the work in one call.
         """
-        return self._backend.key_gen(seed=seed, activation_epoch=activation_epoch)
+        return self._backend.key_gen_batch(n, activation_epoch=activation_epoch)
     
     def sign(
         self,
@@ -135,11 +252,111 @@ class SignatureScheme:
         
         Important:
             - Each (secret_key, epoch) pair must only be used ONCE!
-            - The secret key must be prepared for the epoch by calling
-              secret_key.advance_preparation() in the background.
+            - The secret key must be prepared for the epoch, preferably with
+              secret_key.start_background_preparation(), which advances the
+              preparation on a background thread while signing continues.
+              Use secret_key.wait_prepared(epoch) to block until it is ready.
             - Reusing an epoch will compromise security!
         """
-        return self._backend.sign(secret_key, epoch, message)
+        if self._message_hash is not None:
+            message = self._message_hash(message)
+        elif len(message) > _PREHASH_THRESHOLD:
+            digest = hashlib.sha3_256(message).digest()
+            return self._sign_prehashed(secret_key, epoch, digest)
+        return self._sign(secret_key, epoch, message)
+    
+    def sign_prehashed(
+        self,
+        secret_key: SecretKey,
+        epoch: int,
+        digest: bytes,
+    ) -> Signature:
+        """
+        Sign a message given its SHA3-256 digest.
+        
+        The result is the same signature sign() produces for the message.
+        Only available with the default "sha3_256" message hash.
+        
+        Args:
+            secret_key: The secret key to sign with.
+            epoch: The epoch for this signature.
+            digest: The SHA3-256 digest of the message (MESSAGE_LENGTH bytes).
+        
+        Returns:
+            The signature.
+        
+        Raises:
+            ValueError: If the scheme uses another message hash, if the
+                       digest has the wrong length, or if the secret key is
+                       not prepared for this epoch.
+        """
+        self._check_prehashed()
+        return self._sign_prehashed(secret_key, epoch, digest)
+    
+    def sign_many(
+        self,
+        secret_key: SecretKey,
+        epochs: List[int],
+        messages: List[bytes],
+    ) -> List[Signature]:
+        """
+        Sign several messages in a single call.
+        
+        Args:
+            secret_key: The secret key to sign with.
+            epochs: The epochs to sign for, one per message.
+            messages: The messages to sign.
+        
+        Returns:
+            The signatures, in the same order as the inputs.
+        
+        Raises:
+            ValueError: If the number of epochs and messages differ, if an
+                       epoch appears more than once, or if the secret key is
+                       not prepared for one of the epochs.
+        
+        Important:
+            The same rules as for sign() apply to every epoch in the batch.
+        """
+        if self._message_hash is not None:
+            messages = [self._message_hash(message) for message in messages]
+        return self._backend.sign_many(secret_key, epochs, messages)
+    
+    def sign_into(
+        self,
+        secret_key: SecretKey,
+        epoch: int,
+        message: bytes,
+        out: bytearray,
+        offset: int = 0,
+    ) -> None:
+        """
+        Sign a message, writing the serialized signature into a buffer.
+        
+        Args:
+            secret_key: The secret key to sign with.
+            epoch: The epoch for this signature.
+            message: The message to sign.
+            out: Preallocated buffer to write the signature to.
+            offset: Position in the buffer to write at (default: 0).
+        
+        Raises:
+            ValueError: If the buffer has fewer than signature_size bytes
+                       from offset onwards, or if the secret key is not
+                       prepared for this epoch.
+        
+        Example:
+            >>> size = scheme.signature_size
+            >>> out = bytearray(len(epochs) * size)
+            >>> for i, (epoch, message) in enumerate(zip(epochs, messages)):
+            >>>     scheme.sign_into(sk, epoch, message, out, offset=i * size)
+        
+        Important:
+            The same rules as for sign() apply.
+        """
+        if self._message_hash is not None:
+            message = self._message_hash(message)
+        self._sign_into(secret_key, epoch, message, out, offset)
     
     def verify(
         self,
@@ -160,7 +377,77 @@ class SignatureScheme:
         Returns:
             True if the signature is valid, False otherwise.
         """
-        return self._backend.verify(public_key, epoch, message, signature)
+        if self._message_hash is not None:
+            message = self._message_hash(message)
+        elif len(message) > _PREHASH_THRESHOLD:
+            digest = hashlib.sha3_256(message).digest()
+            return self._verify_prehashed(public_key, epoch, digest, signature)
+        return self._verify(public_key, epoch, message, signature)
+    
+    def verify_prehashed(
+        self,
+        public_key: PublicKey,
+        epoch: int,
+        digest: bytes,
+        signature: Signature,
+    ) -> bool:
+        """
+        Verify a signature given the SHA3-256 digest of the message.
+        
+        Only available with the default "sha3_256" message hash.
+        
+        Args:
+            public_key: The public key to verify against.
+            epoch: The epoch the signature was created for.
+            digest: The SHA3-256 digest of the message (MESSAGE_LENGTH bytes).
+            signature: The signature to verify.
+        
+        Returns:
+            True if the signature is valid, False otherwise.
+        
+        Raises:
+            ValueError: If the scheme uses another message hash, or if the
+                       digest has the wrong length.
+        """
+        self._check_prehashed()
+        return self._verify_prehashed(public_key, epoch, digest, signature)
+    
+    def verify_batch(
+        self,
+        public_key: PublicKey,
+        items: List[Tuple[int, bytes, Signature]],
+        strict: bool = False,
+    ) -> List[bool]:
+        """
+        Verify several signatures under the same public key in a single call.
+        
+        Args:
+            public_key: The public key to verify against.
+            items: (epoch, message, signature) tuples to verify.
+            strict: If True, stop at the first invalid signature. All later
+                   items are then reported as invalid without being checked.
+        
+        Returns:
+            One bool per item, True if its signature is valid.
+        """
+        epochs = [epoch for epoch, _, _ in items]
+        messages = [message for _, message, _ in items]
+        if self._message_hash is not None:
+            messages = [self._message_hash(message) for message in messages]
+        signatures = [signature for _, _, signature in items]
+        return self._backend.verify_batch(
+            public_key, epochs, messages, signatures, strict=strict
+        )
+    
+    def _check_prehashed(self) -> None:
+        """Reject prehashed calls, which would bypass the message hash."""
+        # With another message hash, sign() signs the SHA3-256 digest of that
+        # hash's digest, which a caller-supplied SHA3-256 digest never matches
+        if self._message_hash is not None:
+            raise ValueError(
+                "Prehashed signing and verification require the sha3_256 "
+                "message hash"
+            )
     
     @property
     def lifetime(self) -> int:
@@ -171,6 +458,80 @@ class SignatureScheme:
             The maximum number of epochs this scheme supports.
         """
         return self._backend.get_lifetime()
+    
+    @property
+    def signature_size(self) -> int:
+        """
+        Get the size of a serialized signature in bytes.
+        
+        Returns:
+            The number of bytes sign_into() writes per signature.
+        """
+        return self._backend.get_signature_size()
+
+
+def _key_cache_path(cache_dir: str, backend, seed: bytes, activation_epoch: int) -> str:
+    """Get the cache file for the key pair generated from these parameters."""
+    h = hashlib.blake2b(digest_size=32)
+    h.update(type(backend).__name__.encode() + b"\0")
+    h.update(struct.pack("<QQ", backend.get_lifetime(), activation_epoch))
+    h.update(seed)
+    return os.path.join(cache_dir, h.hexdigest() + ".keys")
+
+
+def _load_cached_keys(path: str) -> Optional[Tuple[PublicKey, SecretKey]]:
+    """Load a cached key pair, or return None if there is no usable entry."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    
+    if len(data) < _KEY_CACHE_HEADER.size:
+        return None
+    pk_len, sk_len, prepared_start, prepared_end = _KEY_CACHE_HEADER.unpack_from(data)
+    pk_start = _KEY_CACHE_HEADER.size
+    sk_start = pk_start + pk_len
+    if len(data) != sk_start + sk_len:
+        return None
+    
+    try:
+        public_key = PublicKey.from_bytes(data[pk_start:sk_start])
+        secret_key = SecretKey.from_bytes(data[sk_start:], prepared_start, prepared_end)
+    except ValueError:
+        return None
+    return public_key, secret_key
+
+
+def _store_cached_keys(path: str, public_key: PublicKey, secret_key: SecretKey) -> None:
+    """Atomically write a key pair to the cache."""
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+    
+    pk_bytes = public_key.to_bytes()
+    sk_bytes = secret_key.to_bytes()
+    header = _KEY_CACHE_HEADER.pack(
+        len(pk_bytes),
+        len(sk_bytes),
+        secret_key.get_prepared_start(),
+        secret_key.get_prepared_end(),
+    )
+    
+    # mkstemp creates the file readable by the owner only
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+    try:
+        try:
+            f = os.fdopen(fd, "wb")
+        except BaseException:
+            os.close(fd)
+            raise
+        with f:
+            f.write(header + pk_bytes + sk_bytes)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
 
 
 def prepare_secret_key_for_epoch(
@@ -182,7 +543,15 @@ def prepare_secret_key_for_epoch(
     Utility function to prepare a secret key for a specific epoch.
     
     This advances the secret key's preparation interval until it includes
-    the target epoch.
+    the target epoch. Without a step limit, and when the backend supports
+    it, the interval jumps straight to the target instead of stepping
+    through every interval in between. Otherwise it is stepped forward,
+    natively in the backend where possible to avoid one Python/Rust round
+    trip per step.
+    
+    This blocks until the key is prepared. To keep signing while the key is
+    prepared for a later epoch, use secret_key.start_background_preparation()
+    and secret_key.wait_prepared() instead.
     
     Args:
         secret_key: The secret key to prepare.
@@ -191,7 +560,11 @@ def prepare_secret_key_for_epoch(
                        If None, continues until prepared.
     
     Returns:
-        True if successfully prepared, False if max_iterations was reached.
+        True if successfully prepared, False if max_iterations was reached
+        or the target epoch lies before the prepared interval.
+    
+    Note:
+        Epochs skipped over can no longer be signed for.
     
     Example:
         >>> scheme = SignatureScheme.sha3()
@@ -201,6 +574,14 @@ def prepare_secret_key_for_epoch(
         >>> if prepare_secret_key_for_epoch(sk, 1000):
         >>>     signature = scheme.sign(sk, 1000, b"message")
     """
+    jump = getattr(secret_key, "jump_to_epoch", None)
+    if jump is not None and max_iterations is None:
+        return jump(target_epoch)
+    
+    advance_until = getattr(secret_key, "advance_preparation_until", None)
+    if advance_until is not None:
+        return advance_until(target_epoch, max_iterations)
+    
     iterations = 0
     while not secret_key.is_prepared_for_epoch(target_epoch):
         if max_iterations is not None and iterations >= max_iterations:
@@ -29,8 +29,8 @@ def simple_example():
     
     # Check if epoch is prepared
     if not sk.is_prepared_for_epoch(epoch):
-        print(f"Epoch {epoch} not prepared, advancing preparation...")
-        sk.advance_preparation()
+        print(f"Epoch {epoch} not prepared, jumping preparation ahead...")
+        sk.jump_to_epoch(epoch)
         print(f"New prepared interval: [{sk.get_prepared_start()}, {sk.get_prepared_end()})")
     
     signature = scheme.sign(sk, epoch, message)
@@ -67,7 +67,7 @@ def poseidon_example():
     print(f"\nSigning message at epoch {epoch}: {message}")
     
     if not sk.is_prepared_for_epoch(epoch):
-        sk.advance_preparation()
+        sk.jump_to_epoch(epoch)
     
     signature = scheme.sign(sk, epoch, message)
     print(f"Signature: {signature}")
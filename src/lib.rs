@@ -1,10 +1,63 @@
-use pyo3::exceptions::PyValueError;
+use std::collections::HashSet;
+use std::ops::{Deref, Range};
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::sync::{
+    Arc, Condvar, Mutex, OnceLock, PoisonError, RwLock, RwLockReadGuard, RwLockWriteGuard,
+};
+use std::thread::{self, JoinHandle};
+use std::time::{Duration, Instant};
+
+use pyo3::buffer::PyBuffer;
+use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
+use pyo3::types::{PyByteArray, PyBytes};
+use rayon::prelude::*;
+use sha3::{Digest, Sha3_256};
 
 // Import the hash-sig library types
 // Note: Currently using placeholder implementations
 // In a real implementation, these would be used to wrap the actual hash-sig types
 
+/// A bytes-like argument: bytes, bytearray, memoryview or any other object
+/// exporting a buffer of bytes
+///
+/// C-contiguous buffers are read in place, anything else is copied once on
+/// extraction. The contents must only be read with the GIL held, as Python code
+/// could otherwise write to a mutable buffer such as a bytearray underneath.
+enum BytesLike {
+    Buffer(PyBuffer<u8>),
+    Copied(Vec<u8>),
+}
+
+impl<'py> FromPyObject<'py> for BytesLike {
+    fn extract_bound(ob: &Bound<'py, PyAny>) -> PyResult<Self> {
+        let buffer = PyBuffer::<u8>::get(ob)?;
+        if buffer.is_c_contiguous() {
+            Ok(BytesLike::Buffer(buffer))
+        } else {
+            Ok(BytesLike::Copied(buffer.to_vec(ob.py())?))
+        }
+    }
+}
+
+impl Deref for BytesLike {
+    type Target = [u8];
+
+    fn deref(&self) -> &[u8] {
+        match self {
+            BytesLike::Buffer(buffer) if buffer.len_bytes() > 0 => {
+                // SAFETY: the buffer is C-contiguous, so it holds len_bytes() bytes at
+                // buf_ptr(), and it stays exported for as long as the PyBuffer lives
+                unsafe {
+                    std::slice::from_raw_parts(buffer.buf_ptr() as *const u8, buffer.len_bytes())
+                }
+            }
+            BytesLike::Buffer(_) => &[],
+            BytesLike::Copied(data) => data,
+        }
+    }
+}
+
 /// Python wrapper for the public key
 #[pyclass]
 #[derive(Clone)]
@@ -15,14 +68,20 @@ pub struct PyPublicKey {
 #[pymethods]
 impl PyPublicKey {
     /// Serialize the public key to bytes
-    fn to_bytes(&self) -> PyResult<Vec<u8>> {
-        Ok(self.inner.clone())
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        Ok(PyBytes::new(py, &self.inner))
+    }
+
+    fn __bytes__<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, &self.inner)
     }
 
     /// Deserialize a public key from bytes
     #[staticmethod]
-    fn from_bytes(data: Vec<u8>) -> PyResult<Self> {
-        Ok(PyPublicKey { inner: data })
+    fn from_bytes(data: BytesLike) -> PyResult<Self> {
+        Ok(PyPublicKey {
+            inner: data.to_vec(),
+        })
     }
 
     fn __repr__(&self) -> String {
@@ -30,50 +89,451 @@ impl PyPublicKey {
     }
 }
 
-/// Python wrapper for the secret key
-#[pyclass]
-pub struct PySecretKey {
+/// Mutable state of a secret key
+struct SecretKeyState {
     inner: Vec<u8>,
     prepared_start: u64,
     prepared_end: u64,
+    /// Number of background threads currently advancing the preparation
+    preparing: usize,
+}
+
+impl SecretKeyState {
+    fn is_prepared_for_epoch(&self, epoch: u64) -> bool {
+        epoch >= self.prepared_start && epoch < self.prepared_end
+    }
+
+    /// Move the interval forward by its width, or return false (leaving it
+    /// unchanged) if the next interval would run past u64::MAX
+    fn advance_preparation(&mut self) -> bool {
+        // Update the prepared interval
+        // In a real implementation, this would call sk.advance_preparation()
+        let width = self.prepared_end - self.prepared_start;
+        match self.prepared_end.checked_add(width) {
+            Some(end) => {
+                self.prepared_start = self.prepared_end;
+                self.prepared_end = end;
+                true
+            }
+            None => false,
+        }
+    }
+
+    fn jump_to_epoch(&mut self, target_epoch: u64) -> bool {
+        // The interval only ever moves forward
+        if target_epoch < self.prepared_start {
+            return false;
+        }
+
+        // Land on the interval that repeated advances would reach, without
+        // preparing any of the intervals in between
+        // In a real implementation, this would derive only the bottom trees covering
+        // the target epoch from the PRF seed, i.e. O(log N) hashes along one path
+        let width = self.prepared_end - self.prepared_start;
+        let steps = (target_epoch - self.prepared_start) / width;
+        let interval = steps
+            .checked_mul(width)
+            .and_then(|offset| self.prepared_start.checked_add(offset))
+            .and_then(|start| Some((start, start.checked_add(width)?)));
+
+        // Targets in the last, partial interval below u64::MAX cannot be reached
+        match interval {
+            Some((start, end)) => {
+                self.prepared_start = start;
+                self.prepared_end = end;
+                true
+            }
+            None => false,
+        }
+    }
+}
+
+/// Secret key state shared between a key and its background preparation thread
+///
+/// Signing only reads the state, so any number of signatures can be computed
+/// concurrently. Advancing the preparation takes the write lock.
+struct SharedSecretKey {
+    state: RwLock<SecretKeyState>,
+    /// Held while waiting for and signalling changes, so that no change is missed
+    signal: Mutex<()>,
+    /// Signalled whenever the prepared interval moves or preparation stops
+    changed: Condvar,
+}
+
+impl SharedSecretKey {
+    fn read(&self) -> RwLockReadGuard<'_, SecretKeyState> {
+        // The state is only ever updated in place, so it stays consistent even if
+        // a thread panicked while holding the lock
+        self.state.read().unwrap_or_else(PoisonError::into_inner)
+    }
+
+    fn write(&self) -> RwLockWriteGuard<'_, SecretKeyState> {
+        self.state.write().unwrap_or_else(PoisonError::into_inner)
+    }
+
+    /// Wake up the threads waiting for a change (call after releasing the state)
+    fn notify(&self) {
+        let _signal = self.signal.lock().unwrap_or_else(PoisonError::into_inner);
+        self.changed.notify_all();
+    }
+
+    /// Advance the preparation one step at a time until it contains the target
+    /// epoch, holding the write lock only for the duration of each step
+    fn advance_until(
+        &self,
+        target_epoch: u64,
+        max_iterations: Option<u64>,
+        stop: &AtomicBool,
+    ) -> bool {
+        let mut iterations = 0;
+        loop {
+            {
+                let mut state = self.write();
+                // The interval only ever moves forward
+                if target_epoch < state.prepared_start {
+                    return false;
+                }
+                if state.is_prepared_for_epoch(target_epoch) {
+                    return true;
+                }
+                if stop.load(Ordering::Relaxed)
+                    || max_iterations.is_some_and(|max| iterations >= max)
+                {
+                    return false;
+                }
+                if !state.advance_preparation() {
+                    return false;
+                }
+            }
+            self.notify();
+            iterations += 1;
+        }
+    }
+
+    /// Wait until the key is prepared for an epoch, for at most WAIT_SLICE
+    ///
+    /// Returns None if the slice ran out before the wait was over, so the caller
+    /// can check for signals before waiting again.
+    fn wait_prepared_slice(&self, epoch: u64, deadline: Option<Instant>) -> Option<bool> {
+        let slice_end = Instant::now() + WAIT_SLICE;
+        // Changes are signalled with the signal mutex held, so a change made after
+        // the state is read below still wakes up the wait that follows
+        let mut signal = self.signal.lock().unwrap_or_else(PoisonError::into_inner);
+        loop {
+            {
+                let state = self.read();
+                if state.preparing == 0 || state.is_prepared_for_epoch(epoch) {
+                    return Some(state.is_prepared_for_epoch(epoch));
+                }
+            }
+
+            let now = Instant::now();
+            if deadline.is_some_and(|deadline| now >= deadline) {
+                return Some(self.read().is_prepared_for_epoch(epoch));
+            }
+            if now >= slice_end {
+                return None;
+            }
+
+            let wake = deadline.map_or(slice_end, |deadline| deadline.min(slice_end));
+            signal = self
+                .changed
+                .wait_timeout(signal, wake - now)
+                .unwrap_or_else(PoisonError::into_inner)
+                .0;
+        }
+    }
+}
+
+/// Longest time wait_prepared waits with the GIL released before checking for
+/// signals, so that Ctrl-C can interrupt a long wait
+const WAIT_SLICE: Duration = Duration::from_millis(100);
+
+/// Counts a background preparation as running for as long as it is alive
+///
+/// Dropping the guard, also while unwinding from a panic, marks the preparation
+/// as finished and wakes up the threads waiting for it.
+struct PreparingGuard(Arc<SharedSecretKey>);
+
+impl PreparingGuard {
+    fn new(shared: Arc<SharedSecretKey>) -> Self {
+        shared.write().preparing += 1;
+        PreparingGuard(shared)
+    }
+}
+
+impl Drop for PreparingGuard {
+    fn drop(&mut self) {
+        self.0.write().preparing -= 1;
+        self.0.notify();
+    }
+}
+
+/// Handle to a running background preparation thread
+struct BackgroundPreparation {
+    stop: Arc<AtomicBool>,
+    handle: JoinHandle<()>,
+}
+
+impl BackgroundPreparation {
+    fn stop(self) {
+        self.stop.store(true, Ordering::Relaxed);
+        // A panic on the thread has already been accounted for by its guard, and
+        // there is no caller on that thread to forward it to
+        let _ = self.handle.join();
+    }
+}
+
+/// Python wrapper for the secret key
+#[pyclass]
+pub struct PySecretKey {
+    shared: Arc<SharedSecretKey>,
+    background: Mutex<Option<BackgroundPreparation>>,
+}
+
+impl PySecretKey {
+    fn new(inner: Vec<u8>, prepared_start: u64, prepared_end: u64) -> Self {
+        PySecretKey {
+            shared: Arc::new(SharedSecretKey {
+                state: RwLock::new(SecretKeyState {
+                    inner,
+                    prepared_start,
+                    prepared_end,
+                    preparing: 0,
+                }),
+                signal: Mutex::new(()),
+                changed: Condvar::new(),
+            }),
+            background: Mutex::new(None),
+        }
+    }
+
+    fn read(&self) -> RwLockReadGuard<'_, SecretKeyState> {
+        self.shared.read()
+    }
+
+    fn write(&self) -> RwLockWriteGuard<'_, SecretKeyState> {
+        self.shared.write()
+    }
+
+    fn take_background(&self) -> Option<BackgroundPreparation> {
+        self.background
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .take()
+    }
+}
+
+impl Drop for PySecretKey {
+    fn drop(&mut self) {
+        if let Some(background) = self.take_background() {
+            background.stop();
+        }
+    }
 }
 
 #[pymethods]
 impl PySecretKey {
     /// Get the prepared interval start
     fn get_prepared_start(&self) -> u64 {
-        self.prepared_start
+        self.read().prepared_start
     }
 
     /// Get the prepared interval end
     fn get_prepared_end(&self) -> u64 {
-        self.prepared_end
+        self.read().prepared_end
     }
 
     /// Check if an epoch is in the prepared interval
     fn is_prepared_for_epoch(&self, epoch: u64) -> bool {
-        epoch >= self.prepared_start && epoch < self.prepared_end
+        self.read().is_prepared_for_epoch(epoch)
     }
 
     /// Advance the preparation interval
     /// This should be called in the background as epochs are used
-    fn advance_preparation(&mut self) -> PyResult<()> {
-        // Update the prepared interval
-        // In a real implementation, this would call sk.advance_preparation()
-        self.prepared_start = self.prepared_end;
-        self.prepared_end += self.prepared_end - self.prepared_start;
+    ///
+    /// Raises:
+    ///     ValueError: If the next interval would run past 2^64
+    fn advance_preparation(&self) -> PyResult<()> {
+        let mut state = self.write();
+        if !state.advance_preparation() {
+            return Err(PyValueError::new_err(format!(
+                "Cannot advance the prepared interval [{}, {}) past 2^64",
+                state.prepared_start, state.prepared_end
+            )));
+        }
+        drop(state);
+        self.shared.notify();
         Ok(())
     }
 
+    /// Advance the preparation interval until it contains the target epoch
+    ///
+    /// Args:
+    ///     target_epoch: The epoch to prepare for
+    ///     max_iterations: Maximum number of preparation steps to take.
+    ///                     If None, continues until prepared.
+    ///
+    /// Returns:
+    ///     True if the key is prepared for the target epoch, False if
+    ///     max_iterations was reached, the epoch lies before the interval, or
+    ///     the next interval would run past 2^64
+    #[pyo3(signature = (target_epoch, max_iterations=None))]
+    fn advance_preparation_until(
+        &self,
+        py: Python<'_>,
+        target_epoch: u64,
+        max_iterations: Option<u64>,
+    ) -> bool {
+        let shared = &self.shared;
+        py.allow_threads(|| {
+            shared.advance_until(target_epoch, max_iterations, &AtomicBool::new(false))
+        })
+    }
+
+    /// Move the preparation interval directly to the target epoch
+    ///
+    /// Args:
+    ///     target_epoch: The epoch to prepare for
+    ///
+    /// Returns:
+    ///     True if the key is prepared for the target epoch, False if the epoch
+    ///     lies before the interval or so close to 2^64 that the interval covering
+    ///     it would overflow (the interval is then left unchanged)
+    ///
+    /// Unlike advance_preparation_until, this does not step through every interval
+    /// in between, so the cost does not grow with the distance to the target.
+    ///
+    /// Limitations: Epochs between the old interval and the target are skipped and
+    /// can no longer be signed for, as the interval never moves backwards. Seeking
+    /// relies on the underlying scheme deriving each part of the key from the seed
+    /// independently.
+    fn jump_to_epoch(&self, target_epoch: u64) -> bool {
+        let prepared = self.write().jump_to_epoch(target_epoch);
+        self.shared.notify();
+        prepared
+    }
+
+    /// Start advancing the preparation interval on a background thread
+    ///
+    /// Args:
+    ///     target_epoch: The epoch to prepare for
+    ///
+    /// The thread takes the key's write lock only for one preparation step at a
+    /// time, so signing for already prepared epochs can go on meanwhile. It stops
+    /// once the target epoch is prepared. Any preparation already running is
+    /// stopped first.
+    ///
+    /// Raises:
+    ///     RuntimeError: If the thread cannot be started
+    fn start_background_preparation(&self, py: Python<'_>, target_epoch: u64) -> PyResult<()> {
+        self.stop_background_preparation(py);
+
+        let guard = PreparingGuard::new(Arc::clone(&self.shared));
+        let stop = Arc::new(AtomicBool::new(false));
+        let thread_stop = Arc::clone(&stop);
+        // If the thread cannot be spawned, the closure is dropped and the guard
+        // with it, so the preparation does not stay counted as running
+        let handle = thread::Builder::new()
+            .name("hashsig-preparation".to_string())
+            .spawn(move || {
+                let PreparingGuard(shared) = &guard;
+                shared.advance_until(target_epoch, None, &thread_stop);
+            })
+            .map_err(|err| {
+                PyRuntimeError::new_err(format!("Failed to start background preparation: {}", err))
+            })?;
+
+        // Another thread may have started a preparation in the meantime. The lock
+        // is not held while joining it, as that waits with the GIL released.
+        let replaced = self
+            .background
+            .lock()
+            .unwrap_or_else(PoisonError::into_inner)
+            .replace(BackgroundPreparation { stop, handle });
+        if let Some(previous) = replaced {
+            py.allow_threads(|| previous.stop());
+        }
+        Ok(())
+    }
+
+    /// Stop the background preparation, if any, and wait for its thread to exit
+    fn stop_background_preparation(&self, py: Python<'_>) {
+        if let Some(background) = self.take_background() {
+            py.allow_threads(|| background.stop());
+        }
+    }
+
+    /// Wait until the key is prepared for an epoch
+    ///
+    /// Args:
+    ///     epoch: The epoch to wait for
+    ///     timeout: Maximum number of seconds to wait. If None, waits as long as
+    ///              background preparation is running.
+    ///
+    /// Returns:
+    ///     True if the key is prepared for the epoch, False if the timeout expired
+    ///     or background preparation stopped before reaching it
+    ///
+    /// The wait checks for signals periodically, so Ctrl-C interrupts it with
+    /// KeyboardInterrupt.
+    #[pyo3(signature = (epoch, timeout=None))]
+    fn wait_prepared(&self, py: Python<'_>, epoch: u64, timeout: Option<f64>) -> PyResult<bool> {
+        let deadline = match timeout {
+            None => None,
+            Some(secs) => {
+                let timeout = Duration::try_from_secs_f64(secs)
+                    .map_err(|_| PyValueError::new_err(format!("Invalid timeout {}", secs)))?;
+                // A deadline too far ahead to represent is as good as none
+                Instant::now().checked_add(timeout)
+            }
+        };
+
+        let shared = &self.shared;
+        loop {
+            let outcome = py.allow_threads(|| shared.wait_prepared_slice(epoch, deadline));
+            if let Some(prepared) = outcome {
+                return Ok(prepared);
+            }
+            // Let Ctrl-C and other signal handlers interrupt a long wait
+            py.check_signals()?;
+        }
+    }
+
     /// Serialize the secret key to bytes (WARNING: Keep this secure!)
-    fn to_bytes(&self) -> PyResult<Vec<u8>> {
-        Ok(self.inner.clone())
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        Ok(PyBytes::new(py, &self.read().inner))
+    }
+
+    fn __bytes__<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, &self.read().inner)
+    }
+
+    /// Deserialize a secret key from bytes
+    ///
+    /// The prepared interval is not part of the serialized key, so it has to be
+    /// passed alongside the bytes (see get_prepared_start / get_prepared_end).
+    #[staticmethod]
+    fn from_bytes(data: BytesLike, prepared_start: u64, prepared_end: u64) -> PyResult<Self> {
+        if prepared_start >= prepared_end {
+            return Err(PyValueError::new_err(format!(
+                "Invalid prepared interval [{}, {})",
+                prepared_start, prepared_end
+            )));
+        }
+
+        Ok(PySecretKey::new(
+            data.to_vec(),
+            prepared_start,
+            prepared_end,
+        ))
     }
 
     fn __repr__(&self) -> String {
+        let state = self.read();
         format!(
             "SecretKey(prepared=[{}, {}))",
-            self.prepared_start, self.prepared_end
+            state.prepared_start, state.prepared_end
         )
     }
 }
@@ -88,14 +548,20 @@ pub struct PySignature {
 #[pymethods]
 impl PySignature {
     /// Serialize the signature to bytes
-    fn to_bytes(&self) -> PyResult<Vec<u8>> {
-        Ok(self.inner.clone())
+    fn to_bytes<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyBytes>> {
+        Ok(PyBytes::new(py, &self.inner))
+    }
+
+    fn __bytes__<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, &self.inner)
     }
 
     /// Deserialize a signature from bytes
     #[staticmethod]
-    fn from_bytes(data: Vec<u8>) -> PyResult<Self> {
-        Ok(PySignature { inner: data })
+    fn from_bytes(data: BytesLike) -> PyResult<Self> {
+        Ok(PySignature {
+            inner: data.to_vec(),
+        })
     }
 
     fn __repr__(&self) -> String {
@@ -107,6 +573,107 @@ impl PySignature {
     }
 }
 
+/// Length of the message that is actually signed
+///
+/// hash-sig signs fixed-size messages, so arbitrary messages are first hashed down
+/// to this length with SHA3-256.
+const MESSAGE_LENGTH: usize = 32;
+
+/// Hash an arbitrary message down to the fixed length hash-sig signs
+fn message_digest(message: &[u8]) -> [u8; MESSAGE_LENGTH] {
+    Sha3_256::digest(message).into()
+}
+
+/// Hash a batch of bytes-like messages (requires the GIL)
+fn message_digests(messages: &[Bound<'_, PyAny>]) -> PyResult<Vec<[u8; MESSAGE_LENGTH]>> {
+    messages
+        .iter()
+        .map(|message| Ok(message_digest(&message.extract::<BytesLike>()?)))
+        .collect()
+}
+
+/// Check that a prehashed message has the length hash-sig signs
+fn check_digest(digest: &[u8]) -> PyResult<&[u8; MESSAGE_LENGTH]> {
+    digest.try_into().map_err(|_| {
+        PyValueError::new_err(format!(
+            "Message digest must be {} bytes, got {}",
+            MESSAGE_LENGTH,
+            digest.len()
+        ))
+    })
+}
+
+/// Get the range of `size` bytes at `offset` in an output buffer of length `len`
+fn output_range(len: usize, offset: usize, size: usize) -> PyResult<Range<usize>> {
+    match offset.checked_add(size) {
+        Some(end) if end <= len => Ok(offset..end),
+        _ => Err(PyValueError::new_err(format!(
+            "Output buffer of {} bytes has no room for {} bytes at offset {}",
+            len, size, offset
+        ))),
+    }
+}
+
+/// Check that the per-signature argument lists of a batch call line up
+fn check_batch_len(epochs: usize, other: usize, what: &str) -> PyResult<()> {
+    if epochs != other {
+        return Err(PyValueError::new_err(format!(
+            "Got {} epochs but {} {}",
+            epochs, other, what
+        )));
+    }
+    Ok(())
+}
+
+/// Check that a batch signs every epoch at most once
+///
+/// Signing twice for the same epoch reuses the one-time key of that epoch, which
+/// breaks security, so such a batch is rejected before anything is signed.
+fn check_distinct_epochs(epochs: &[u64]) -> PyResult<()> {
+    let mut seen = HashSet::with_capacity(epochs.len());
+    for &epoch in epochs {
+        if !seen.insert(epoch) {
+            return Err(PyValueError::new_err(format!(
+                "Epoch {} appears more than once in the batch",
+                epoch
+            )));
+        }
+    }
+    Ok(())
+}
+
+/// Verify a batch of signatures (may be called without the GIL)
+///
+/// In strict mode, verification stops at the first invalid signature and all
+/// remaining entries are reported as invalid. Otherwise, all signatures are
+/// verified in parallel.
+fn verify_all<F>(
+    epochs: &[u64],
+    digests: &[[u8; MESSAGE_LENGTH]],
+    signatures: &[&PySignature],
+    strict: bool,
+    verify: F,
+) -> PyResult<Vec<bool>>
+where
+    F: Fn(u64, &[u8; MESSAGE_LENGTH], &PySignature) -> PyResult<bool> + Sync,
+{
+    if strict {
+        let mut results = vec![false; epochs.len()];
+        for (i, result) in results.iter_mut().enumerate() {
+            *result = verify(epochs[i], &digests[i], signatures[i])?;
+            if !*result {
+                break;
+            }
+        }
+        return Ok(results);
+    }
+
+    (epochs, digests, signatures)
+        .into_par_iter()
+        .map(|(&epoch, digest, &signature)| verify(epoch, digest, signature))
+        .collect()
+}
+
 /// Hash-based signature scheme using SHA3
 /// This represents one of the instantiations from hashsig::signature::generalized_xmss
 #[pyclass]
@@ -114,6 +681,82 @@ pub struct HashSigSHA3 {
     lifetime: u64,
 }
 
+impl HashSigSHA3 {
+    /// Size of a serialized signature in bytes
+    const SIGNATURE_SIZE: usize = 256; // Placeholder
+
+    fn generate_key_pair(
+        &self,
+        _seed: Option<&[u8]>,
+        activation_epoch: u64,
+    ) -> (PyPublicKey, PySecretKey) {
+        // In a real implementation, this would:
+        // 1. Create an RNG from the seed (or use system random)
+        // 2. Call T::key_gen(&mut rng, activation_epoch, self.lifetime)
+        // 3. Serialize the keys
+
+        // For now, return placeholder keys
+        let pk = PyPublicKey {
+            inner: vec![0; 64], // Placeholder
+        };
+
+        let sk = PySecretKey::new(
+            vec![0; 128], // Placeholder
+            activation_epoch,
+            activation_epoch + 1000,
+        );
+
+        (pk, sk)
+    }
+
+    fn sign_digest(
+        &self,
+        secret_key: &PySecretKey,
+        epoch: u64,
+        digest: &[u8; MESSAGE_LENGTH],
+    ) -> PyResult<PySignature> {
+        let mut inner = vec![0; Self::SIGNATURE_SIZE];
+        self.sign_digest_into(secret_key, epoch, digest, &mut inner)?;
+        Ok(PySignature { inner })
+    }
+
+    fn sign_digest_into(
+        &self,
+        secret_key: &PySecretKey,
+        epoch: u64,
+        _digest: &[u8; MESSAGE_LENGTH],
+        out: &mut [u8],
+    ) -> PyResult<()> {
+        // Check that the epoch is prepared
+        // The read lock lets other signatures with the same key proceed in parallel
+        let sk = secret_key.read();
+        if !sk.is_prepared_for_epoch(epoch) {
+            return Err(PyValueError::new_err(format!(
+                "Secret key not prepared for epoch {}. Prepared interval: [{}, {})",
+                epoch, sk.prepared_start, sk.prepared_end
+            )));
+        }
+
+        // In a real implementation, this would call T::sign(&sk, epoch, &digest) and
+        // serialize the signature straight into the output buffer
+
+        out.fill(0); // Placeholder
+        Ok(())
+    }
+
+    fn verify_digest(
+        &self,
+        _public_key: &PyPublicKey,
+        _epoch: u64,
+        _digest: &[u8; MESSAGE_LENGTH],
+        _signature: &PySignature,
+    ) -> PyResult<bool> {
+        // In a real implementation, this would call T::verify(&pk, epoch, &digest, &sig)
+
+        Ok(true) // Placeholder
+    }
+}
+
 #[pymethods]
 impl HashSigSHA3 {
     #[new]
@@ -132,29 +775,45 @@ impl HashSigSHA3 {
     ///
     /// Returns:
     ///     Tuple of (public_key, secret_key)
-    #[pyo3(signature = (_seed=None, activation_epoch=0))]
+    ///
+    /// The GIL is released while the keys are generated, so several keys can be
+    /// generated concurrently from Python threads.
+    #[pyo3(signature = (seed=None, activation_epoch=0))]
     fn key_gen(
         &self,
-        _seed: Option<Vec<u8>>,
+        py: Python<'_>,
+        seed: Option<Vec<u8>>,
         activation_epoch: u64,
     ) -> PyResult<(PyPublicKey, PySecretKey)> {
-        // In a real implementation, this would:
-        // 1. Create an RNG from the seed (or use system random)
-        // 2. Call T::key_gen(&mut rng, activation_epoch, self.lifetime)
-        // 3. Serialize the keys
-
-        // For now, return placeholder keys
-        let pk = PyPublicKey {
-            inner: vec![0; 64], // Placeholder
-        };
-
-        let sk = PySecretKey {
-            inner: vec![0; 128], // Placeholder
-            prepared_start: activation_epoch,
-            prepared_end: activation_epoch + 1000,
-        };
+        // The seed has already been copied into a Rust-owned buffer, so nothing
+        // borrowed from Python is touched while the GIL is released
+        Ok(py.allow_threads(|| self.generate_key_pair(seed.as_deref(), activation_epoch)))
+    }
 
-        Ok((pk, sk))
+    /// Generate several key pairs in one call
+    ///
+    /// Args:
+    ///     n: Number of key pairs to generate
+    ///     activation_epoch: The epoch at which the keys become active (default: 0)
+    ///
+    /// Returns:
+    ///     List of (public_key, secret_key) tuples
+    ///
+    /// Generating the keys in a single call avoids one Python/Rust round trip per
+    /// key. Each key is generated independently, in parallel with the GIL released.
+    #[pyo3(signature = (n, activation_epoch=0))]
+    fn key_gen_batch(
+        &self,
+        py: Python<'_>,
+        n: usize,
+        activation_epoch: u64,
+    ) -> PyResult<Vec<(PyPublicKey, PySecretKey)>> {
+        Ok(py.allow_threads(|| {
+            (0..n)
+                .into_par_iter()
+                .map(|_| self.generate_key_pair(None, activation_epoch))
+                .collect()
+        }))
     }
 
     /// Sign a message for a specific epoch
@@ -162,30 +821,110 @@ impl HashSigSHA3 {
     /// Args:
     ///     secret_key: The secret key to sign with
     ///     epoch: The epoch for this signature (must be in prepared interval)
-    ///     message: The message to sign (bytes)
+    ///     message: The message to sign (bytes-like)
     ///
     /// Returns:
     ///     The signature
     ///
+    /// The message is hashed to MESSAGE_LENGTH bytes with SHA3-256 before signing,
+    /// so this is equivalent to sign_prehashed with that digest.
+    ///
     /// Important: Each (secret_key, epoch) pair must only be used once!
     fn sign(
         &self,
         secret_key: &PySecretKey,
         epoch: u64,
-        _message: Vec<u8>,
+        message: BytesLike,
     ) -> PyResult<PySignature> {
-        // Check that the epoch is prepared
-        if !secret_key.is_prepared_for_epoch(epoch) {
-            return Err(PyValueError::new_err(format!(
-                "Secret key not prepared for epoch {}. Prepared interval: [{}, {})",
-                epoch, secret_key.prepared_start, secret_key.prepared_end
-            )));
-        }
+        self.sign_digest(secret_key, epoch, &message_digest(&message))
+    }
+
+    /// Sign the SHA3-256 digest of a message for a specific epoch
+    ///
+    /// Args:
+    ///     secret_key: The secret key to sign with
+    ///     epoch: The epoch for this signature (must be in prepared interval)
+    ///     digest: SHA3-256 digest of the message (MESSAGE_LENGTH bytes)
+    ///
+    /// Returns:
+    ///     The signature
+    ///
+    /// Important: Each (secret_key, epoch) pair must only be used once!
+    fn sign_prehashed(
+        &self,
+        secret_key: &PySecretKey,
+        epoch: u64,
+        digest: BytesLike,
+    ) -> PyResult<PySignature> {
+        self.sign_digest(secret_key, epoch, check_digest(&digest)?)
+    }
 
-        // In a real implementation, this would call T::sign(&sk, epoch, &message)
+    /// Sign a message into a caller-provided buffer
+    ///
+    /// Args:
+    ///     secret_key: The secret key to sign with
+    ///     epoch: The epoch for this signature (must be in prepared interval)
+    ///     message: The message to sign (bytes-like)
+    ///     out: Buffer to write the serialized signature to (bytearray)
+    ///     offset: Position in the buffer to write at (default: 0)
+    ///
+    /// Writes get_signature_size() bytes at the offset, so one preallocated buffer
+    /// can hold many signatures back to back without a new allocation per signature.
+    ///
+    /// Important: Each (secret_key, epoch) pair must only be used once!
+    #[pyo3(signature = (secret_key, epoch, message, out, offset=0))]
+    fn sign_into(
+        &self,
+        secret_key: &PySecretKey,
+        epoch: u64,
+        message: BytesLike,
+        out: &Bound<'_, PyByteArray>,
+        offset: usize,
+    ) -> PyResult<()> {
+        let digest = message_digest(&message);
+        let range = output_range(out.len(), offset, Self::SIGNATURE_SIZE)?;
+        // SAFETY: the GIL is held and no Python code runs while the slice is alive,
+        // so the bytearray cannot be resized or freed underneath it
+        let out = unsafe { &mut out.as_bytes_mut()[range] };
+        self.sign_digest_into(secret_key, epoch, &digest, out)
+    }
 
-        Ok(PySignature {
-            inner: vec![0; 256], // Placeholder
+    /// Sign several messages, one per epoch
+    ///
+    /// Args:
+    ///     secret_key: The secret key to sign with
+    ///     epochs: The epochs to sign for (each must be in prepared interval)
+    ///     messages: The messages to sign, one per epoch
+    ///
+    /// Returns:
+    ///     The signatures, in the same order as the inputs
+    ///
+    /// The signatures are computed in parallel with the GIL released. A batch that
+    /// repeats an epoch is rejected with ValueError before anything is signed.
+    ///
+    /// Important: Each (secret_key, epoch) pair must only be used once!
+    fn sign_many(
+        &self,
+        py: Python<'_>,
+        secret_key: &PySecretKey,
+        epochs: Vec<u64>,
+        messages: Vec<Bound<'_, PyAny>>,
+    ) -> PyResult<Vec<PySignature>> {
+        check_batch_len(epochs.len(), messages.len(), "messages")?;
+        check_distinct_epochs(&epochs)?;
+        let digests = message_digests(&messages)?;
+
+        // In a real implementation, this would hash the chains of all signatures
+        // with matching chain lengths together instead of one signature at a time
+
+        // Epochs and digests are Rust-owned, so nothing borrowed from Python is
+        // touched while the GIL is released
+        py.allow_threads(|| {
+            epochs
+                .into_par_iter()
+                .zip(digests)
+                .map(|(epoch, digest)| self.sign_digest(secret_key, epoch, &digest))
+                .collect()
         })
     }
 
@@ -194,27 +933,94 @@ impl HashSigSHA3 {
     /// Args:
     ///     public_key: The public key to verify against
     ///     epoch: The epoch the signature was created for
-    ///     message: The message that was signed (bytes)
+    ///     message: The message that was signed (bytes-like)
     ///     signature: The signature to verify
     ///
     /// Returns:
     ///     True if the signature is valid, False otherwise
     fn verify(
         &self,
-        _public_key: &PyPublicKey,
-        _epoch: u64,
-        _message: Vec<u8>,
-        _signature: &PySignature,
+        public_key: &PyPublicKey,
+        epoch: u64,
+        message: BytesLike,
+        signature: &PySignature,
     ) -> PyResult<bool> {
-        // In a real implementation, this would call T::verify(&pk, epoch, &message, &sig)
+        self.verify_digest(public_key, epoch, &message_digest(&message), signature)
+    }
 
-        Ok(true) // Placeholder
+    /// Verify a signature over the SHA3-256 digest of a message
+    ///
+    /// Args:
+    ///     public_key: The public key to verify against
+    ///     epoch: The epoch the signature was created for
+    ///     digest: SHA3-256 digest of the message (MESSAGE_LENGTH bytes)
+    ///     signature: The signature to verify
+    ///
+    /// Returns:
+    ///     True if the signature is valid, False otherwise
+    fn verify_prehashed(
+        &self,
+        public_key: &PyPublicKey,
+        epoch: u64,
+        digest: BytesLike,
+        signature: &PySignature,
+    ) -> PyResult<bool> {
+        self.verify_digest(public_key, epoch, check_digest(&digest)?, signature)
+    }
+
+    /// Verify several signatures under the same public key in one call
+    ///
+    /// Args:
+    ///     public_key: The public key to verify against
+    ///     epochs: The epochs the signatures were created for
+    ///     messages: The messages that were signed, one per epoch
+    ///     signatures: The signatures to verify, one per epoch
+    ///     strict: Stop at the first invalid signature (default: False)
+    ///
+    /// Returns:
+    ///     One bool per signature, True if it is valid. In strict mode, every
+    ///     signature after the first invalid one is reported as invalid without
+    ///     being checked.
+    ///
+    /// The signatures are verified in parallel with the GIL released, sharing the
+    /// public key across the whole batch.
+    #[pyo3(signature = (public_key, epochs, messages, signatures, strict=false))]
+    fn verify_batch(
+        &self,
+        py: Python<'_>,
+        public_key: &PyPublicKey,
+        epochs: Vec<u64>,
+        messages: Vec<Bound<'_, PyAny>>,
+        signatures: Vec<PyRef<'_, PySignature>>,
+        strict: bool,
+    ) -> PyResult<Vec<bool>> {
+        check_batch_len(epochs.len(), messages.len(), "messages")?;
+        check_batch_len(epochs.len(), signatures.len(), "signatures")?;
+        let digests = message_digests(&messages)?;
+        let signatures: Vec<&PySignature> = signatures.iter().map(|sig| &**sig).collect();
+
+        // Epochs and digests are Rust-owned and the signatures stay borrowed for the
+        // whole call, so nothing is released back to Python while the GIL is dropped
+        py.allow_threads(|| {
+            verify_all(
+                &epochs,
+                &digests,
+                &signatures,
+                strict,
+                |epoch, digest, sig| self.verify_digest(public_key, epoch, digest, sig),
+            )
+        })
     }
 
     /// Get the lifetime (maximum number of epochs) for this scheme
     fn get_lifetime(&self) -> u64 {
         self.lifetime
     }
+
+    /// Get the size of a serialized signature in bytes
+    fn get_signature_size(&self) -> usize {
+        Self::SIGNATURE_SIZE
+    }
 }
 
 /// Hash-based signature scheme using Poseidon2
@@ -223,6 +1029,61 @@ pub struct HashSigPoseidon {
     lifetime: u64,
 }
 
+impl HashSigPoseidon {
+    const SIGNATURE_SIZE: usize = 256;
+
+    fn generate_key_pair(
+        &self,
+        _seed: Option<&[u8]>,
+        activation_epoch: u64,
+    ) -> (PyPublicKey, PySecretKey) {
+        let pk = PyPublicKey { inner: vec![0; 64] };
+
+        let sk = PySecretKey::new(vec![0; 128], activation_epoch, activation_epoch + 1000);
+
+        (pk, sk)
+    }
+
+    fn sign_digest(
+        &self,
+        secret_key: &PySecretKey,
+        epoch: u64,
+        digest: &[u8; MESSAGE_LENGTH],
+    ) -> PyResult<PySignature> {
+        let mut inner = vec![0; Self::SIGNATURE_SIZE];
+        self.sign_digest_into(secret_key, epoch, digest, &mut inner)?;
+        Ok(PySignature { inner })
+    }
+
+    fn sign_digest_into(
+        &self,
+        secret_key: &PySecretKey,
+        epoch: u64,
+        _digest: &[u8; MESSAGE_LENGTH],
+        out: &mut [u8],
+    ) -> PyResult<()> {
+        if !secret_key.is_prepared_for_epoch(epoch) {
+            return Err(PyValueError::new_err(format!(
+                "Secret key not prepared for epoch {}",
+                epoch
+            )));
+        }
+
+        out.fill(0);
+        Ok(())
+    }
+
+    fn verify_digest(
+        &self,
+        _public_key: &PyPublicKey,
+        _epoch: u64,
+        _digest: &[u8; MESSAGE_LENGTH],
+        _signature: &PySignature,
+    ) -> PyResult<bool> {
+        Ok(true)
+    }
+}
+
 #[pymethods]
 impl HashSigPoseidon {
     #[new]
@@ -233,54 +1094,167 @@ impl HashSigPoseidon {
         }
     }
 
-    #[pyo3(signature = (_seed=None, activation_epoch=0))]
+    #[pyo3(signature = (seed=None, activation_epoch=0))]
     fn key_gen(
         &self,
-        _seed: Option<Vec<u8>>,
+        py: Python<'_>,
+        seed: Option<Vec<u8>>,
         activation_epoch: u64,
     ) -> PyResult<(PyPublicKey, PySecretKey)> {
-        let pk = PyPublicKey { inner: vec![0; 64] };
-
-        let sk = PySecretKey {
-            inner: vec![0; 128],
-            prepared_start: activation_epoch,
-            prepared_end: activation_epoch + 1000,
-        };
+        Ok(py.allow_threads(|| self.generate_key_pair(seed.as_deref(), activation_epoch)))
+    }
 
-        Ok((pk, sk))
+    #[pyo3(signature = (n, activation_epoch=0))]
+    fn key_gen_batch(
+        &self,
+        py: Python<'_>,
+        n: usize,
+        activation_epoch: u64,
+    ) -> PyResult<Vec<(PyPublicKey, PySecretKey)>> {
+        Ok(py.allow_threads(|| {
+            (0..n)
+                .into_par_iter()
+                .map(|_| self.generate_key_pair(None, activation_epoch))
+                .collect()
+        }))
     }
 
     fn sign(
         &self,
         secret_key: &PySecretKey,
         epoch: u64,
-        _message: Vec<u8>,
+        message: BytesLike,
     ) -> PyResult<PySignature> {
-        if !secret_key.is_prepared_for_epoch(epoch) {
-            return Err(PyValueError::new_err(format!(
-                "Secret key not prepared for epoch {}",
-                epoch
-            )));
-        }
+        self.sign_digest(secret_key, epoch, &message_digest(&message))
+    }
 
-        Ok(PySignature {
-            inner: vec![0; 256],
+    fn sign_prehashed(
+        &self,
+        secret_key: &PySecretKey,
+        epoch: u64,
+        digest: BytesLike,
+    ) -> PyResult<PySignature> {
+        self.sign_digest(secret_key, epoch, check_digest(&digest)?)
+    }
+
+    #[pyo3(signature = (secret_key, epoch, message, out, offset=0))]
+    fn sign_into(
+        &self,
+        secret_key: &PySecretKey,
+        epoch: u64,
+        message: BytesLike,
+        out: &Bound<'_, PyByteArray>,
+        offset: usize,
+    ) -> PyResult<()> {
+        let digest = message_digest(&message);
+        let range = output_range(out.len(), offset, Self::SIGNATURE_SIZE)?;
+        // SAFETY: see HashSigSHA3::sign_into
+        let out = unsafe { &mut out.as_bytes_mut()[range] };
+        self.sign_digest_into(secret_key, epoch, &digest, out)
+    }
+
+    fn sign_many(
+        &self,
+        py: Python<'_>,
+        secret_key: &PySecretKey,
+        epochs: Vec<u64>,
+        messages: Vec<Bound<'_, PyAny>>,
+    ) -> PyResult<Vec<PySignature>> {
+        check_batch_len(epochs.len(), messages.len(), "messages")?;
+        check_distinct_epochs(&epochs)?;
+        let digests = message_digests(&messages)?;
+
+        py.allow_threads(|| {
+            epochs
+                .into_par_iter()
+                .zip(digests)
+                .map(|(epoch, digest)| self.sign_digest(secret_key, epoch, &digest))
+                .collect()
         })
     }
 
     fn verify(
         &self,
-        _public_key: &PyPublicKey,
-        _epoch: u64,
-        _message: Vec<u8>,
-        _signature: &PySignature,
+        public_key: &PyPublicKey,
+        epoch: u64,
+        message: BytesLike,
+        signature: &PySignature,
     ) -> PyResult<bool> {
-        Ok(true)
+        self.verify_digest(public_key, epoch, &message_digest(&message), signature)
+    }
+
+    fn verify_prehashed(
+        &self,
+        public_key: &PyPublicKey,
+        epoch: u64,
+        digest: BytesLike,
+        signature: &PySignature,
+    ) -> PyResult<bool> {
+        self.verify_digest(public_key, epoch, check_digest(&digest)?, signature)
+    }
+
+    #[pyo3(signature = (public_key, epochs, messages, signatures, strict=false))]
+    fn verify_batch(
+        &self,
+        py: Python<'_>,
+        public_key: &PyPublicKey,
+        epochs: Vec<u64>,
+        messages: Vec<Bound<'_, PyAny>>,
+        signatures: Vec<PyRef<'_, PySignature>>,
+        strict: bool,
+    ) -> PyResult<Vec<bool>> {
+        check_batch_len(epochs.len(), messages.len(), "messages")?;
+        check_batch_len(epochs.len(), signatures.len(), "signatures")?;
+        let digests = message_digests(&messages)?;
+        let signatures: Vec<&PySignature> = signatures.iter().map(|sig| &**sig).collect();
+
+        py.allow_threads(|| {
+            verify_all(
+                &epochs,
+                &digests,
+                &signatures,
+                strict,
+                |epoch, digest, sig| self.verify_digest(public_key, epoch, digest, sig),
+            )
+        })
     }
 
     fn get_lifetime(&self) -> u64 {
         self.lifetime
     }
+
+    fn get_signature_size(&self) -> usize {
+        Self::SIGNATURE_SIZE
+    }
+}
+
+/// Keccak implementation picked by the keccak crate, detected once
+static CPU_BACKEND: OnceLock<&'static str> = OnceLock::new();
+
+fn detect_cpu_backend() -> &'static str {
+    // With the `asm` feature, the keccak crate switches to the SHA3-extension
+    // permutation when the CPU has it, and runs the portable one everywhere else
+    #[cfg(target_arch = "aarch64")]
+    {
+        if std::arch::is_aarch64_feature_detected!("sha3") {
+            return "armv8-sha3";
+        }
+    }
+
+    "portable"
+}
+
+/// Get the name of the Keccak implementation used for SHA3 hashing
+///
+/// Returns:
+///     "armv8-sha3" on aarch64 CPUs with the SHA3 extension, "portable" otherwise
+///
+/// This mirrors the runtime dispatch in the keccak crate, which has no SIMD
+/// implementation on x86. The CPU is probed once, on first use. This is meant for
+/// diagnostics, e.g. to check that a prebuilt wheel uses the hardware permutation.
+#[pyfunction]
+fn cpu_backend() -> &'static str {
+    *CPU_BACKEND.get_or_init(detect_cpu_backend)
 }
 
 /// Python module for hash-sig bindings
@@ -291,5 +1265,7 @@ fn hashsig_py(m: &Bound<PyModule>) -> PyResult<()> {
     m.add_class::<PySignature>()?;
     m.add_class::<HashSigSHA3>()?;
     m.add_class::<HashSigPoseidon>()?;
+    m.add_function(wrap_pyfunction!(cpu_backend, m)?)?;
+    m.add("MESSAGE_LENGTH", MESSAGE_LENGTH)?;
     Ok(())
 }
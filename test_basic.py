@@ -3,13 +3,31 @@
 Basic test for the hashsig Python bindings.
 """
 
+import hashlib
 import hashsig_py
+import importlib.util
 import os
+import sys
+import tempfile
+
+
+def load_wrapper():
+    """Load the SignatureScheme wrapper in __init__.py on top of the built module."""
+    sys.modules.setdefault("hashsig._hashsig_py", hashsig_py)
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "__init__.py")
+    spec = importlib.util.spec_from_file_location(
+        "hashsig", path, submodule_search_locations=[]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["hashsig"] = module
+    spec.loader.exec_module(module)
+    return module
 
 
 def test_basic_functionality():
     """Test basic functionality of the Python bindings."""
     print("=== Testing Hash-Sig Python Bindings ===\n")
+    print(f"CPU backend: {hashsig_py.cpu_backend()}\n")
     
     # Test SHA3 scheme
     print("1. Testing HashSigSHA3...")
@@ -30,8 +48,8 @@ def test_basic_functionality():
     
     # Check if epoch is prepared
     if not sk.is_prepared_for_epoch(epoch):
-        print(f"   Epoch {epoch} not prepared, advancing preparation...")
-        sk.advance_preparation()
+        print(f"   Epoch {epoch} not prepared, jumping preparation ahead...")
+        sk.jump_to_epoch(epoch)
         print(f"   New prepared interval: [{sk.get_prepared_start()}, {sk.get_prepared_end()})")
     
     signature = sha3_scheme.sign(sk, epoch, message)
@@ -42,6 +60,22 @@ def test_basic_functionality():
     is_valid = sha3_scheme.verify(pk, epoch, message, signature)
     print(f"   Signature valid: {is_valid}")
     
+    # Test signing a prehashed message
+    digest = hashlib.sha3_256(message).digest()
+    prehashed = sha3_scheme.sign_prehashed(sk, epoch + 1, digest)
+    assert sha3_scheme.verify_prehashed(pk, epoch + 1, digest, prehashed)
+    
+    # Any bytes-like object is accepted, not only bytes
+    view_signature = sha3_scheme.sign(sk, epoch + 3, memoryview(message))
+    assert sha3_scheme.verify(pk, epoch + 3, bytearray(message), view_signature)
+    assert sha3_scheme.verify_prehashed(pk, epoch + 1, bytearray(digest), prehashed)
+    try:
+        sha3_scheme.sign_prehashed(sk, epoch + 2, digest[:16])
+    except ValueError:
+        print("   Short digest rejected")
+    else:
+        raise AssertionError("expected ValueError for short digest")
+    
     # Test Poseidon scheme
     print("\n5. Testing HashSigPoseidon...")
     poseidon_scheme = hashsig_py.HashSigPoseidon()
@@ -70,21 +104,358 @@ def test_key_serialization():
     sk_bytes = sk.to_bytes()
     print(f"   Secret key bytes length: {len(sk_bytes)}")
     
+    restored = hashsig_py.PySecretKey.from_bytes(
+        sk_bytes, sk.get_prepared_start(), sk.get_prepared_end()
+    )
+    assert restored.to_bytes() == sk_bytes
+    assert restored.get_prepared_end() == sk.get_prepared_end()
+    
     # Test signature serialization
     print("\n3. Testing signature serialization...")
     epoch = 50
     message = b"Test message"
     
     if not sk.is_prepared_for_epoch(epoch):
-        sk.advance_preparation()
+        sk.jump_to_epoch(epoch)
     
     signature = scheme.sign(sk, epoch, message)
     sig_bytes = signature.to_bytes()
     print(f"   Signature bytes length: {len(sig_bytes)}")
     
+    # Round-trip through bytes
+    assert isinstance(sig_bytes, bytes)
+    assert bytes(signature) == sig_bytes
+    assert hashsig_py.PySignature.from_bytes(sig_bytes).to_bytes() == sig_bytes
+    assert hashsig_py.PyPublicKey.from_bytes(pk_bytes).to_bytes() == pk_bytes
+    
     print("\n✓ Serialization tests completed successfully!")
 
 
+def test_batch_key_generation():
+    """Test generating several key pairs in one call."""
+    print("\n=== Testing Batch Key Generation ===\n")
+    
+    scheme = hashsig_py.HashSigSHA3()
+    keys = scheme.key_gen_batch(4, activation_epoch=10)
+    print(f"   Generated {len(keys)} key pairs")
+    assert len(keys) == 4
+    
+    for pk, sk in keys:
+        assert sk.get_prepared_start() == 10
+    
+    print("\n✓ Batch key generation tests completed successfully!")
+
+
+def test_sign_many():
+    """Test signing and verifying several messages in one call."""
+    print("\n=== Testing Batch Signing ===\n")
+    
+    scheme = hashsig_py.HashSigSHA3()
+    pk, sk = scheme.key_gen()
+    
+    epochs = [1, 2, 3]
+    messages = [b"first", b"second", b"third"]
+    signatures = scheme.sign_many(sk, epochs, messages)
+    print(f"   Produced {len(signatures)} signatures")
+    assert len(signatures) == len(epochs)
+    
+    for epoch, message, signature in zip(epochs, messages, signatures):
+        assert scheme.verify(pk, epoch, message, signature)
+    
+    results = scheme.verify_batch(pk, epochs, messages, signatures)
+    print(f"   Batch verification: {results}")
+    assert results == [True] * len(epochs)
+    assert scheme.verify_batch(pk, epochs, messages, signatures, strict=True) == results
+    
+    # Sign into one preallocated buffer, with padding on both sides
+    size = scheme.get_signature_size()
+    pad = 8
+    end = pad + len(epochs) * size
+    out = bytearray(b"\xff" * (end + pad))
+    for i, (epoch, message) in enumerate(zip(epochs, messages)):
+        scheme.sign_into(sk, epoch + 10, message, out, offset=pad + i * size)
+    for i in range(len(epochs)):
+        written = out[pad + i * size:pad + (i + 1) * size]
+        assert written != b"\xff" * size
+    assert out[:pad] == b"\xff" * pad
+    assert out[end:] == b"\xff" * pad
+    signature = hashsig_py.PySignature.from_bytes(out[pad + size:pad + 2 * size])
+    assert len(signature) == size
+    
+    try:
+        scheme.sign_into(sk, 20, b"no room", out, offset=len(out) - 1)
+    except ValueError:
+        print("   Undersized output buffer rejected")
+    else:
+        raise AssertionError("expected ValueError for undersized buffer")
+    
+    try:
+        scheme.sign_many(sk, [1, 2], [b"only one"])
+    except ValueError:
+        print("   Mismatched batch rejected")
+    else:
+        raise AssertionError("expected ValueError for mismatched batch")
+    
+    try:
+        scheme.sign_many(sk, [5, 5], [b"first", b"second"])
+    except ValueError:
+        print("   Repeated epoch rejected")
+    else:
+        raise AssertionError("expected ValueError for repeated epoch")
+    
+    print("\n✓ Batch signing tests completed successfully!")
+
+
+def test_advance_preparation_until():
+    """Test advancing the preparation interval to a later epoch."""
+    print("\n=== Testing Preparation Advancement ===\n")
+    
+    scheme = hashsig_py.HashSigSHA3()
+    pk, sk = scheme.key_gen()
+    
+    target = 5_500
+    assert not sk.advance_preparation_until(target, max_iterations=1)
+    assert sk.advance_preparation_until(target)
+    assert sk.is_prepared_for_epoch(target)
+    print(f"   Prepared interval: [{sk.get_prepared_start()}, {sk.get_prepared_end()})")
+    
+    # The interval never moves backwards
+    assert not sk.advance_preparation_until(0)
+    
+    # Jump far ahead without stepping through the intervals in between
+    target = 1_000_500
+    assert sk.jump_to_epoch(target)
+    assert sk.is_prepared_for_epoch(target)
+    assert sk.get_prepared_end() - sk.get_prepared_start() == 1000
+    assert not sk.jump_to_epoch(0)
+    
+    # A target whose interval would run past 2^64 leaves the key alone
+    start = sk.get_prepared_start()
+    assert not sk.jump_to_epoch(2**64 - 1)
+    assert sk.get_prepared_start() == start
+    
+    # Advancing stops where the next interval would run past 2^64
+    _, edge_sk = scheme.key_gen()
+    assert edge_sk.jump_to_epoch(2**64 - 1500)
+    edge = (edge_sk.get_prepared_start(), edge_sk.get_prepared_end())
+    assert not edge_sk.advance_preparation_until(2**64 - 1)
+    try:
+        edge_sk.advance_preparation()
+    except ValueError:
+        print("   Overflowing advance rejected")
+    else:
+        raise AssertionError("expected ValueError for overflowing advance")
+    assert (edge_sk.get_prepared_start(), edge_sk.get_prepared_end()) == edge
+    
+    # A step limit is honoured rather than jumping past it
+    hashsig = load_wrapper()
+    assert not hashsig.prepare_secret_key_for_epoch(sk, target + 10_000, max_iterations=0)
+    assert sk.get_prepared_start() == start
+    assert hashsig.prepare_secret_key_for_epoch(sk, target + 10_000)
+    
+    print("\n✓ Preparation advancement tests completed successfully!")
+
+
+def test_background_preparation():
+    """Test advancing the preparation interval on a background thread."""
+    print("\n=== Testing Background Preparation ===\n")
+    
+    scheme = hashsig_py.HashSigSHA3()
+    pk, sk = scheme.key_gen()
+    
+    target = 9_500
+    sk.start_background_preparation(target)
+    assert sk.wait_prepared(target, timeout=10.0)
+    sk.stop_background_preparation()
+    print(f"   Prepared interval: [{sk.get_prepared_start()}, {sk.get_prepared_end()})")
+    
+    # Nothing is running, so waiting for an unprepared epoch returns at once
+    assert not sk.wait_prepared(target + 10_000)
+    
+    signature = scheme.sign(sk, target, b"prepared in the background")
+    assert scheme.verify(pk, target, b"prepared in the background", signature)
+    
+    # Stopping mid-run leaves the key short of the target
+    far = 10**15
+    sk.start_background_preparation(far)
+    sk.stop_background_preparation()
+    assert not sk.is_prepared_for_epoch(far)
+    assert not sk.wait_prepared(far)
+    print("   Stopped a running preparation")
+    
+    # Starting again replaces the running preparation and stops its thread
+    sk.start_background_preparation(far)
+    sk.start_background_preparation(far + 1)
+    sk.stop_background_preparation()
+    assert not sk.wait_prepared(far + 1)
+    print("   Replaced a running preparation")
+    
+    # A key can be dropped while its thread is running
+    _, dropped_sk = scheme.key_gen()
+    dropped_sk.start_background_preparation(far)
+    del dropped_sk
+    print("   Dropped a key during preparation")
+    
+    # A preparation that cannot advance past 2^64 ends instead of hanging waiters
+    _, edge_sk = scheme.key_gen()
+    assert edge_sk.jump_to_epoch(2**64 - 1500)
+    edge_sk.start_background_preparation(2**64 - 1)
+    assert not edge_sk.wait_prepared(2**64 - 1)
+    
+    # A timeout too large for a deadline waits without one
+    assert edge_sk.wait_prepared(edge_sk.get_prepared_start(), timeout=1e19)
+    
+    print("\n✓ Background preparation tests completed successfully!")
+
+
+def test_scheme_prehashing():
+    """Test that SignatureScheme prehashes large messages transparently."""
+    print("\n=== Testing Large Message Prehashing ===\n")
+    
+    hashsig = load_wrapper()
+    backend = hashsig_py.HashSigSHA3()
+    scheme = hashsig.SignatureScheme(backend)
+    seed = bytes(range(32))
+    
+    # Two copies of the same key, so both paths can sign the same epoch
+    pk, sk = scheme.key_gen(seed=seed)
+    _, sk_copy = scheme.key_gen(seed=seed)
+    
+    epoch = 3
+    message = b"m" * (hashsig._PREHASH_THRESHOLD + 1)
+    signature = scheme.sign(sk, epoch, message)
+    expected = backend.sign(sk_copy, epoch, message)
+    assert signature.to_bytes() == expected.to_bytes()
+    assert scheme.verify(pk, epoch, message, expected)
+    assert backend.verify(pk, epoch, message, signature)
+    print(f"   {len(message)}-byte message matches the backend signature")
+    
+    print("\n✓ Prehashing tests completed successfully!")
+
+
+def test_scheme_message_hash():
+    """Test signing with a non-default message hash."""
+    print("\n=== Testing Message Hash Selection ===\n")
+    
+    hashsig = load_wrapper()
+    backend = hashsig_py.HashSigSHA3()
+    scheme = hashsig.SignatureScheme(backend, message_hash="blake2b")
+    sha3_scheme = hashsig.SignatureScheme(backend)
+    pk, sk = scheme.key_gen()
+    
+    message = b"hashed with blake2b"
+    signature = scheme.sign(sk, 1, message)
+    assert scheme.verify(pk, 1, message, signature)
+    
+    epochs = [2, 3]
+    messages = [b"first", b"second"]
+    signatures = scheme.sign_many(sk, epochs, messages)
+    items = list(zip(epochs, messages, signatures))
+    assert scheme.verify_batch(pk, items) == [True, True]
+    
+    out = bytearray(scheme.signature_size)
+    scheme.sign_into(sk, 4, message, out)
+    assert scheme.verify(pk, 4, message, hashsig.Signature.from_bytes(out))
+    print("   sign, sign_many and sign_into verify under blake2b")
+    
+    # The placeholder backend accepts every signature, so a mismatched hash can
+    # only be seen once verification actually checks the signature
+    if not scheme.verify(pk, 1, b"not the message", signature):
+        assert not sha3_scheme.verify(pk, 1, message, signature)
+    
+    digest = hashlib.sha3_256(message).digest()
+    for call in (
+        lambda: scheme.sign_prehashed(sk, 5, digest),
+        lambda: scheme.verify_prehashed(pk, 1, digest, signature),
+    ):
+        try:
+            call()
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("expected ValueError for prehashed call")
+    print("   Prehashed calls rejected under blake2b")
+    
+    try:
+        hashsig.SignatureScheme(backend, message_hash="md5")
+    except ValueError:
+        print("   Unknown message hash rejected")
+    else:
+        raise AssertionError("expected ValueError for unknown message hash")
+    
+    # Pretend the blake3 package is not installed
+    blake3 = hashsig._blake3
+    hashsig._blake3 = None
+    try:
+        hashsig.SignatureScheme(backend, message_hash="blake3")
+    except ValueError:
+        print("   Missing blake3 package reported")
+    else:
+        raise AssertionError("expected ValueError for missing blake3")
+    finally:
+        hashsig._blake3 = blake3
+    
+    print("\n✓ Message hash tests completed successfully!")
+
+
+def test_key_cache():
+    """Test caching seeded key generation on disk."""
+    print("\n=== Testing Key Cache ===\n")
+    
+    hashsig = load_wrapper()
+    scheme = hashsig.SignatureScheme.sha3()
+    seed = bytes(range(32))
+    
+    def key_gen():
+        return scheme.key_gen(seed=seed, activation_epoch=5)
+    
+    previous = os.environ.get("HASHSIG_CACHE_DIR")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["HASHSIG_CACHE_DIR"] = cache_dir
+        try:
+            # Round trip through the cache
+            pk, sk = key_gen()
+            (entry,) = os.listdir(cache_dir)
+            path = os.path.join(cache_dir, entry)
+            with open(path, "rb") as f:
+                data = f.read()
+            
+            cached_pk, cached_sk = key_gen()
+            assert cached_pk.to_bytes() == pk.to_bytes()
+            assert cached_sk.to_bytes() == sk.to_bytes()
+            assert cached_sk.get_prepared_start() == sk.get_prepared_start()
+            assert cached_sk.get_prepared_end() == sk.get_prepared_end()
+            print("   Cached key pair loaded")
+            
+            # Truncated and corrupt entries are regenerated and rewritten
+            header = hashsig._KEY_CACHE_HEADER
+            pk_len, sk_len, start, _ = header.unpack_from(data)
+            empty_interval = header.pack(pk_len, sk_len, start, start)
+            empty_interval += data[header.size:]
+            for corrupt in (data[:header.size - 1], data[:-1], empty_interval):
+                with open(path, "wb") as f:
+                    f.write(corrupt)
+                _, regenerated_sk = key_gen()
+                assert regenerated_sk.get_prepared_end() == sk.get_prepared_end()
+                with open(path, "rb") as f:
+                    assert f.read() == data
+            print("   Corrupt entries regenerated")
+            
+            # An entry that cannot be read or replaced does not break key_gen
+            os.remove(path)
+            os.mkdir(path)
+            _, uncached_sk = key_gen()
+            assert uncached_sk.get_prepared_end() == sk.get_prepared_end()
+            print("   Unusable cache skipped")
+        finally:
+            if previous is None:
+                del os.environ["HASHSIG_CACHE_DIR"]
+            else:
+                os.environ["HASHSIG_CACHE_DIR"] = previous
+    
+    print("\n✓ Key cache tests completed successfully!")
+
+
 def main():
     """Run all tests."""
     print("Hash-Sig Python Bindings - Basic Test")
@@ -96,6 +467,13 @@ def main():
     try:
         test_basic_functionality()
         test_key_serialization()
+        test_batch_key_generation()
+        test_sign_many()
+        test_advance_preparation_until()
+        test_background_preparation()
+        test_scheme_prehashing()
+        test_scheme_message_hash()
+        test_key_cache()
         
         print("\n" + "=" * 50)
         print("All tests passed! ✓")
@@ -105,6 +483,7 @@ def main():
         print(f"\n❌ Error: {e}")
         import traceback
         traceback.print_exc()
+        sys.exit(1)
 
 
 if __name__ == "__main__":